@@ -1,4 +1,5 @@
 from celery import Celery
+from celery.signals import after_setup_logger, after_setup_task_logger
 
 from app.config.loader import settings
 
@@ -21,7 +22,20 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
     result_expires=3600,  # 1 hour
+    task_routes={
+        "app.tasks.search.crawl_jobs": {"queue": "crawl"},
+        "app.tasks.search.process_jobs_with_ai": {"queue": "ai"},
+        "app.tasks.search.process_job_batch": {"queue": "ai"},
+        "app.tasks.search.store_jobs": {"queue": "ai"},
+    },
 )
 
+
+@after_setup_logger.connect
+@after_setup_task_logger.connect
+def apply_log_level(logger, *args, **kwargs):
+    logger.setLevel(settings.LOG_LEVEL)
+
+
 if __name__ == "__main__":
     celery_app.start()
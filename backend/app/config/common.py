@@ -11,6 +11,8 @@ from pydantic import (
 
 from pydantic_core import MultiHostUrl
 
+from app.config.logs import DEFAULT_LOG_LEVEL, LoggingLevel
+
 
 def parse_cors(v: Any) -> list[str] | str:
     if isinstance(v, str) and not v.startswith("["):
@@ -40,6 +42,9 @@ class AppConfig(BaseSettings):
             return f"http://{self.DOMAIN}"
         return f"https://{self.DOMAIN}"
 
+    LOG_LEVEL: Annotated[LoggingLevel,
+                         Field(alias="LOG_LEVEL")] = DEFAULT_LOG_LEVEL
+
     BACKEND_CORS_ORIGINS: Annotated[
         list[AnyUrl] | str, BeforeValidator(parse_cors)
     ] = Field(default_factory=list)
@@ -49,6 +54,11 @@ class AppConfig(BaseSettings):
     DB_USER: Annotated[str, Field(alias="DB_USER")] = "postgres"
     DB_PASSWORD: Annotated[str, Field(alias="DB_PASSWORD")] = "password"
     DB_NAME: Annotated[str, Field(alias="DB_NAME")] = "findajob"
+    DB_SSLMODE: Annotated[str, Field(alias="DB_SSLMODE")] = "prefer"
+    DB_CONNECT_TIMEOUT: Annotated[int, Field(alias="DB_CONNECT_TIMEOUT")] = 5
+    DB_POOL_SIZE: Annotated[int, Field(alias="DB_POOL_SIZE")] = 5
+    DB_POOL_MAX_OVERFLOW: Annotated[int, Field(
+        alias="DB_POOL_MAX_OVERFLOW")] = 10
 
     @computed_field
     @property
@@ -68,3 +78,8 @@ class AppConfig(BaseSettings):
         alias="CELERY_RESULT_BACKEND")] = "redis://redis:6379/0"
     WEBHOOK_BASE_URL: Annotated[str, Field(
         alias="WEBHOOK_BASE_URL")] = "http://backend:8000"
+    # Number of jobs analyzed by a single AI task
+    AI_BATCH_SIZE: Annotated[int, Field(alias="AI_BATCH_SIZE", gt=0)] = 4
+    # Celery rate limit for AI batch tasks per worker, e.g. "10/m"
+    AI_RATE_LIMIT: Annotated[str | None, Field(
+        alias="AI_RATE_LIMIT")] = None
@@ -1,9 +1,31 @@
+import os
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.config.loader import settings
 from app.models import Base
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+    # Drop connections the server closed while they sat in the pool
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    # Reuse the most recent connection so surplus ones can idle out
+    pool_use_lifo=True,
+    connect_args={
+        # Keep idle pooled connections alive across NAT/firewalls
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 5,
+        "sslmode": settings.DB_SSLMODE,
+        # Fail fast instead of wedging a worker on an unreachable database
+        "connect_timeout": settings.DB_CONNECT_TIMEOUT,
+        # Make every process identifiable in pg_stat_activity
+        "application_name": f"findajob-{os.getpid()}",
+    },
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -17,6 +39,13 @@ def get_db():
 
 def create_tables():
     Base.metadata.create_all(bind=engine)
+    # create_all only adds indexes along with new tables; add the ones
+    # introduced later to existing databases too
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
-create_tables()
+if __name__ == "__main__":
+    # Run once per deployment: python -m app.config.database
+    create_tables()
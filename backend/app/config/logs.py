@@ -1,6 +1,9 @@
+import atexit
 import logging
+import queue
 from enum import StrEnum
-from typing import Final
+from logging.handlers import QueueHandler, QueueListener
+from typing import Final, Optional
 
 from pydantic import BaseModel, Field
 
@@ -20,17 +23,42 @@ class LoggingSettings(BaseModel):
 DEFAULT_LOG_LEVEL: Final[LoggingLevel] = LoggingLevel.INFO
 
 
+_listener: Optional[QueueListener] = None
+
+
+@atexit.register
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def configure_logging(*, level: LoggingLevel = DEFAULT_LOG_LEVEL) -> None:
+    global _listener
+    _stop_listener()
+
     logging.getLogger().handlers.clear()
 
-    logging.basicConfig(
-        level=getattr(logging, level),
+    # Records are only enqueued by the caller; a listener thread writes them out
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
         datefmt="%Y-%m-%d %H:%M:%S",
-        format=(
+        fmt=(
             "[%(asctime)s.%(msecs)03d] "
             "%(funcName)20s "
             "%(module)s:%(lineno)d "
             "%(levelname)-8s - "
             "%(message)s"
         ),
-    )
\ No newline at end of file
+    ))
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(
+        level=getattr(logging, level),
+        handlers=[queue_handler],
+    )
@@ -1,4 +1,5 @@
 from . import LLM
+from functools import lru_cache
 from logging import Logger
 from typing import List, Union, Optional
 from google.genai.types import Content, GenerateContentConfig, Part
@@ -7,6 +8,12 @@ from pydantic import BaseModel, ValidationError
 from app.schemas.search import AIProviderConfig
 
 
+@lru_cache(maxsize=8)
+def _get_client(api_key: str) -> genai.Client:
+    """Reuse one client (and its HTTP connection pool) per API key."""
+    return genai.Client(api_key=api_key)
+
+
 class GoogleAIProvider(LLM):
     """Google AI provider implementation with CV and job context management."""
 
@@ -16,11 +23,10 @@ class GoogleAIProvider(LLM):
         if not self.config.api_key:
             raise ValueError("Google AI API key is required")
 
-        self.__client = genai.Client(
-            api_key=self.config.api_key,
-        )
+        self.__client = _get_client(self.config.api_key)
 
         self.__history: List[Content] = []
+        self.__system_instructions: Optional[Content] = None
 
     def _update_history(self, role: str, content: Union[List[Part], str]) -> List[Content]:
         if isinstance(content, str):
@@ -33,8 +39,11 @@ class GoogleAIProvider(LLM):
         return self.__history
 
     def _get_system_instructions(self) -> Content:
-        return Content(role="system", parts=[Part(text=l) for l in self.system_prompt.split(
-            "\n") if len(l.strip()) > 0])
+        # The system prompt is fixed once set, so split it into parts only once
+        if self.__system_instructions is None:
+            self.__system_instructions = Content(role="system", parts=[Part(text=l) for l in self.system_prompt.split(
+                "\n") if len(l.strip()) > 0])
+        return self.__system_instructions
 
     def clear_history(self) -> None:
         self.__history.clear()
@@ -42,7 +51,7 @@ class GoogleAIProvider(LLM):
     def generate(self, prompt: str, format: BaseModel) -> Optional[str]:
         """Generate text using Google AI API."""
 
-        self.logger.info(f"Using generate mode")
+        self.logger.info("Using generate mode")
 
         response = self.__client.models.generate_content(
             model=self.config.model,
@@ -60,7 +69,7 @@ class GoogleAIProvider(LLM):
             return format.model_validate_json(response.text).model_dump_json()
         except ValidationError as e:
             self.logger.warning("Unsupported response format")
-            self.logger.debug(f"Response text: {response.text}")
+            self.logger.debug("Response text: %s", response.text)
             return None
 
     def agent(self, prompt: str, format: BaseModel) -> Optional[str]:
@@ -69,7 +78,7 @@ class GoogleAIProvider(LLM):
         if self.tools is None and self.callable_tools is None:
             raise ValueError("Tools are required for agent mode")
 
-        self.logger.info(f"Using agent mode")
+        self.logger.info("Using agent mode")
 
         config = GenerateContentConfig(
             system_instruction=self._get_system_instructions(),
@@ -85,7 +94,8 @@ class GoogleAIProvider(LLM):
         use_tools = response.candidates[0].content.parts[0].function_call
 
         while use_tools:
-            self.logger.info(f"Requested tools: {[t.name for t in use_tools]}")
+            self.logger.info("Requested tools: %s", [
+                             t.name for t in use_tools])
             self._update_history(
                 response.candidates[0].content.role, response.candidates[0].content.parts)
 
@@ -1,16 +1,23 @@
 from . import LLM
+from functools import lru_cache
 from ollama import Client
 from pydantic import BaseModel
 from typing import Dict, List
 from app.schemas.search import AIProviderConfig
 
 
+@lru_cache(maxsize=8)
+def _get_client(host: str) -> Client:
+    """Reuse one client (and its HTTP connection pool) per host."""
+    return Client(host=host)
+
+
 class OllamaProvider(LLM):
     """Ollama AI provider implementation with CV and job context management."""
 
     def __init__(self, config: AIProviderConfig, system_prompt: str = None):
         super().__init__(config, system_prompt)
-        self.__client = Client(host=self.config.base_url)
+        self.__client = _get_client(self.config.base_url)
 
     def generate(self, prompt: str, format: BaseModel) -> str:
         """
@@ -30,7 +30,8 @@ class LinkedInSpider(scrapy.Spider):
             'start': 0,
         }
 
-        self.log(f"Spider initialized with max_jobs limit: {self.max_jobs}")
+        self.logger.debug(
+            "Spider initialized with max_jobs limit: %d", self.max_jobs)
 
     async def start(self):
         """
@@ -38,7 +39,7 @@ class LinkedInSpider(scrapy.Spider):
         using the keywords and location, then sends a request to LinkedIn.
         """
         url = f'{self.base_search_url}?{urlencode(self.__params)}'
-        self.log(f"Starting request for URL: {url}")
+        self.logger.debug("Starting request for URL: %s", url)
         yield scrapy.Request(
             url=url,
             callback=self.parse_search,
@@ -48,25 +49,25 @@ class LinkedInSpider(scrapy.Spider):
         """
         Parses the search results page to get the links to individual job cards.
         """
-        self.log("Parsing search results page...")
+        self.logger.debug("Parsing search results page...")
 
         if response.xpath('//html/body').get() is None:
-            self.log("Reached the end of the search results")
+            self.logger.debug("Reached the end of the search results")
             return
 
         # Walk through all job posting's data-entity-urn to get the jobPosting
         for job_badge in response.xpath('//html/body/li'):
             # Check if we've reached the max_jobs limit
             if self.__jobs_found >= self.max_jobs:
-                self.log(
-                    f"Reached max_jobs limit ({self.max_jobs}). Stopping spider.")
+                self.logger.debug(
+                    "Reached max_jobs limit (%d). Stopping spider.", self.max_jobs)
                 return
 
             job_urn = job_badge.css(
                 'div.base-card::attr(data-entity-urn)').get()
             if job_urn:
                 job_id = job_urn.split(':')[-1]
-                self.log(f"Found job ID: {job_id}")
+                self.logger.debug("Found job ID: %s", job_id)
 
                 # Increment jobs found counter
                 self.__jobs_found += 1
@@ -78,19 +79,19 @@ class LinkedInSpider(scrapy.Spider):
         if self.__jobs_found < self.max_jobs:
             # Increment the start parameter to get the next page of results
             self.__params['start'] = self.__jobs_found
-            self.log(
-                f'Continuing with the next page of results: {self.__params["start"]}')
+            self.logger.debug(
+                "Continuing with the next page of results: %d", self.__params["start"])
             yield scrapy.Request(f'{self.base_search_url}?{urlencode(self.__params)}', callback=self.parse_search)
         else:
-            self.log(
-                f"Reached max_jobs limit ({self.max_jobs}). Stopping pagination.")
+            self.logger.debug(
+                "Reached max_jobs limit (%d). Stopping pagination.", self.max_jobs)
 
     def parse_job(self, response):
         """
         Parses a single detailed job page to extract all specified data.
         This function is called for each job URL found on the search results page.
         """
-        self.log(f"Processing detailed job page: {response.url}")
+        self.logger.debug("Processing detailed job page: %s", response.url)
 
         path_parsers = {
             '//html/body/section': LinkedInSpider.__parse_job_header,
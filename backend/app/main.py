@@ -1,9 +1,13 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from app.config.loader import settings
+from app.config.logs import configure_logging
 from app.routes.job_router import job_router
 from app.routes.search_router import search_router
 
+configure_logging(level=settings.LOG_LEVEL)
+
 openapi_tags = [
     {
         "name": "Jobs",
@@ -18,6 +22,7 @@ openapi_tags = [
 app = FastAPI(
     title="Find a Job API",
     openapi_tags=openapi_tags,
+    default_response_class=ORJSONResponse,
 )
 
 if settings.BACKEND_CORS_ORIGINS:
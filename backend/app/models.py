@@ -23,7 +23,7 @@ class Employer(Base):
     __tablename__ = "employers"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    name: Mapped[str] = mapped_column(String)
+    name: Mapped[str] = mapped_column(String, index=True)
     url: Mapped[str] = mapped_column(String)
     industries: Mapped[str] = mapped_column(String)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
@@ -46,7 +46,7 @@ class JobMeta(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     job_id: Mapped[int] = mapped_column(ForeignKey(
-        "jobs.id"), nullable=False)  # Fixed: job_id not jobs
+        "jobs.id"), nullable=False, index=True)  # Fixed: job_id not jobs
     job_description: Mapped[str] = mapped_column(String)
     employment_type: Mapped[str] = mapped_column(String)
     job_function: Mapped[str] = mapped_column(String)
@@ -79,7 +79,7 @@ class Job(Base):
     status: Mapped[str] = mapped_column(String, default="new")
     source: Mapped[str] = mapped_column(String, default="unknown")
     employer_id: Mapped[int] = mapped_column(
-        ForeignKey("employers.id"), nullable=False)
+        ForeignKey("employers.id"), nullable=False, index=True)
 
     # Use string references for relationships to avoid circular imports
     meta: Mapped["JobMeta"] = relationship(
@@ -1,12 +1,12 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from sqlalchemy.orm import Session
 
 from app.config.database import get_db
-from app.schemas.job import Job, JobAiSummary, JobAiCoverLetter, JobMeta, Employer
+from app.schemas.job import Job
 from app.schemas.task import AIProcessedJobResult
-from app.services.job_service import get_jobs, get_job, delete_job, add_job_entry, update_job_status
+from app.services.job_service import get_jobs, get_job, delete_job, add_job_entry, add_job_entries, get_unknown_job_ids, update_job_status
 
 job_router = APIRouter(
     prefix="/jobs",
@@ -15,34 +15,8 @@ job_router = APIRouter(
 
 
 @job_router.get("/", response_model=List[Job])
-def job_list(db: Session = Depends(get_db)):
-    jobs: List[Job] = []
-    for job in get_jobs(db):
-        jobs.append(Job(
-            id=job.id,
-            title=job.title,
-            location=job.location,
-            url=job.url,
-            status=job.status,
-            source=job.source,
-            employer=Employer(
-                id=job.employer.id,
-                name=job.employer.name,
-                url=job.employer.url,
-                industries=job.employer.industries
-            ),
-            meta=JobMeta(
-                job_description=job.meta.job_description,
-                seniority_level=job.meta.seniority_level,
-                employment_type=job.meta.employment_type,
-                job_function=job.meta.job_function,
-                ai_metadata=JobAiSummary.model_validate_json(
-                    job.meta.ai_metadata),
-                cover_letter=JobAiCoverLetter.model_validate_json(
-                    job.meta.cover_letter)
-            )
-        ))
-    return jobs
+def job_list(limit: int = Query(100, gt=0, le=500), before: Optional[int] = None, db: Session = Depends(get_db)):
+    return get_jobs(db, limit, before)
 
 
 @job_router.get("/{job_id}", response_model=Job)
@@ -68,10 +42,8 @@ def update_status(job_id: int, status: str, db: Session = Depends(get_db)):
 
 @job_router.delete("/{job_id}")
 def job_delete(job_id: int, db: Session = Depends(get_db)):
-    db_job = get_job(db, job_id)
-    if db_job is None:
+    if not delete_job(db, job_id):
         raise HTTPException(status_code=404, detail="Job not found")
-    delete_job(db, job_id)
     return {"message": "Job deleted successfully"}
 
 
@@ -79,3 +51,14 @@ def job_delete(job_id: int, db: Session = Depends(get_db)):
 def job_create(job_entry: AIProcessedJobResult, db: Session = Depends(get_db)):
     add_job_entry(db, job_entry)
     return {"message": "Job created successfully"}
+
+
+@job_router.post("/batch")
+def job_create_batch(job_entries: List[AIProcessedJobResult], db: Session = Depends(get_db)):
+    add_job_entries(db, job_entries)
+    return {"message": "Jobs created successfully"}
+
+
+@job_router.post("/unknown", response_model=List[str])
+def job_filter_unknown(job_ids: List[str], db: Session = Depends(get_db)):
+    return get_unknown_job_ids(db, job_ids)
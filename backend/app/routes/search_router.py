@@ -1,9 +1,25 @@
-from fastapi import APIRouter
+import contextlib
+import hashlib
+
+from celery.backends.redis import RedisBackend
+from celery.result import AsyncResult
+from celery.utils import uuid
+from fastapi import APIRouter, Request, Response
+from redis.exceptions import RedisError
 
 from app.schemas.task import SearchTaskRequest, SearchTaskResponse
-from app.tasks.search import run_search_pipeline
+from app.tasks.search import search_pipeline
+from app.celery_app import celery_app
 from app.config.loader import settings
 
+# Hand a search key over to a new run only if it still holds the finished one
+TAKE_OVER_SEARCH_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("SET", KEYS[1], ARGV[2], "EX", ARGV[3])
+end
+return false
+"""
+
 search_router = APIRouter(
     prefix="/search",
     tags=["Search"]
@@ -14,17 +30,58 @@ search_router = APIRouter(
 def search_jobs(request: SearchTaskRequest):
     webhook_url = f"{settings.WEBHOOK_BASE_URL}/api/jobs"
 
-    task = run_search_pipeline.s(
-        request.spider_config.model_dump(mode="json"),
-        request.ai_provider_config.model_dump(mode="json"),
-        request.ai_provider,
-        request.user_cv.model_dump(mode="json"),
-        webhook_url
-    ).apply_async()
+    # Identical searches still in flight share one pipeline run; the reservation
+    # lives next to the results, so other result backends skip coalescing
+    search_key = "search:" + hashlib.sha256(
+        request.model_dump_json().encode()).hexdigest()
+    task_id = uuid()
+    client = celery_app.backend.client if isinstance(
+        celery_app.backend, RedisBackend) else None
+    # Expire with the task time limit so a lost run can't block the search for good
+    lock_ttl = celery_app.conf.task_time_limit
+    reserved = client is None or client.set(
+        search_key, task_id, nx=True, ex=lock_ttl)
+    while not reserved:
+        running_id = client.get(search_key)
+        if running_id is None:
+            # The reservation expired in the meantime
+            reserved = client.set(search_key, task_id, nx=True, ex=lock_ttl)
+            continue
+        running = AsyncResult(running_id.decode(), app=celery_app)
+        if not running.ready():
+            return SearchTaskResponse(status=running.status, id=running.id)
+        # Of concurrent resubmissions only one takes over a finished run
+        reserved = client.eval(TAKE_OVER_SEARCH_SCRIPT, 1,
+                               search_key, running_id, task_id, lock_ttl)
+
+    try:
+        task = search_pipeline(
+            request.spider_config.model_dump(mode="json"),
+            request.ai_provider_config.model_dump(mode="json"),
+            request.ai_provider,
+            request.user_cv.model_dump(mode="json"),
+            webhook_url
+        ).apply_async(task_id=task_id)
+    except Exception:
+        # Don't leave resubmissions pinned to a task that was never sent
+        if client is not None:
+            with contextlib.suppress(RedisError):
+                if client.get(search_key) == task_id.encode():
+                    client.delete(search_key)
+        raise
     return SearchTaskResponse(status=task.status, id=task.id)
 
 
-@search_router.get("/{task_id}/status")
-def get_task_status(task_id: str):
-    # TODO: Implement proper task status checking
-    return {"status": "unknown", "task_id": task_id}
+@search_router.get("/{task_id}/status", response_model=SearchTaskResponse)
+def get_task_status(task_id: str, request: Request, response: Response):
+    # Single result-backend read; pipeline stages are chained by Celery itself
+    task = AsyncResult(task_id, app=celery_app)
+
+    # The id comes from the URL, so the state alone identifies the body
+    etag = f'"{task.status}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return SearchTaskResponse(status=task.status, id=task.id)
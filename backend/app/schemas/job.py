@@ -1,5 +1,6 @@
-from typing import List
-from pydantic import BaseModel, HttpUrl
+import json
+from typing import Any, List
+from pydantic import BaseModel, ConfigDict, HttpUrl, field_validator
 from app.schemas.employer import Employer
 
 
@@ -33,6 +34,8 @@ class JobAiMetadata(BaseModel):
 
 
 class JobMeta(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     job_description: str
     seniority_level: str
     employment_type: str
@@ -40,8 +43,18 @@ class JobMeta(BaseModel):
     ai_metadata: JobAiSummary
     cover_letter: JobAiCoverLetter
 
+    @field_validator("ai_metadata", "cover_letter", mode="before")
+    @classmethod
+    def parse_json(cls, value: Any) -> Any:
+        # AI results are stored as JSON encoded strings
+        if isinstance(value, str):
+            return json.loads(value)
+        return value
+
 
 class Job(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     title: str
     location: str
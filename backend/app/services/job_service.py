@@ -1,79 +1,111 @@
-from typing import List
-from sqlalchemy.orm import Session
+from typing import List, Optional
+from sqlalchemy import exists, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, joinedload
 
 from app.models import Job, JobMeta, Employer
 from app.schemas.task import AIProcessedJobResult
 
 
-def get_jobs(db: Session) -> List[Job]:
-    return db.query(Job).all()
+def get_jobs(db: Session, limit: int, before: Optional[int] = None) -> List[Job]:
+    # Keyset pagination over the primary key, newest jobs first
+    query = db.query(Job).options(joinedload(Job.meta), joinedload(Job.employer))
+    if before is not None:
+        query = query.filter(Job.id < before)
+    return query.order_by(Job.id.desc()).limit(limit).all()
 
 
 def get_job(db: Session, job_id: int) -> Job:
-    return db.query(Job).filter(Job.id == job_id).first()
+    # Meta and employer are always needed, fetch them in the same query
+    return db.query(Job).options(joinedload(Job.meta), joinedload(Job.employer)).filter(
+        Job.id == job_id).first()
+
+
+def get_unknown_job_ids(db: Session, job_ids: List[str]) -> List[str]:
+    known = {job_id for job_id, in db.query(
+        Job.job_id).filter(Job.job_id.in_(job_ids))}
+    return [job_id for job_id in job_ids if job_id not in known]
 
 
 def add_job_entry(db: Session, job_entry: AIProcessedJobResult) -> None:
-    # Create or get employer
-    employer = db.query(Employer).filter(
-        Employer.name == job_entry.employer).first()
-
-    if not employer:
-        employer = Employer(
-            name=job_entry.employer,
-            url=job_entry.employer_url,
-            industries=job_entry.industries
-        )
-        db.add(employer)
-        db.flush()  # Get the ID
-
-    # Create job
-    job = Job(
-        job_id=job_entry.job_id,
-        title=job_entry.job_title,
-        location=job_entry.job_location,
-        url=job_entry.job_url,
-        status="new",
-        source=job_entry.source,
-        employer_id=employer.id
-    )
-    db.add(job)
-    db.flush()  # Get the job ID
-
-    # Create job meta
-    job_meta = JobMeta(
-        job_id=job.id,
-        job_description=job_entry.job_description,
-        employment_type=job_entry.employment_type,
-        job_function=job_entry.job_function,
-        seniority_level=job_entry.seniority_level,
-        ai_metadata=job_entry.job_summary,
-        cover_letter=job_entry.cover_letter
-    )
-    db.add(job_meta)
+    add_job_entries(db, [job_entry])
 
-    db.commit()
 
+def add_job_entries(db: Session, job_entries: List[AIProcessedJobResult]) -> None:
+    # Keep the first entry of postings listed twice in one batch
+    unique_entries = {}
+    for job_entry in job_entries:
+        unique_entries.setdefault(job_entry.job_id, job_entry)
+    job_entries = list(unique_entries.values())
+    if not job_entries:
+        return
 
-def delete_job(db: Session, job_id: int) -> None:
-    db_job = get_job(db, job_id)
-    if db_job:
-        # Delete the Job record
-        db.delete(db_job)
-        # Check if employer has no more jobs and delete if empty
-        # Use a proper query instead of relationship count
-        remaining_jobs = db.query(Job).filter(Job.employer_id == db_job.employer_id).count()
-        if remaining_jobs == 0:
-            db.delete(db_job.employer)
-        db.commit()
-    return
+    # Resolve stored employers once for the whole batch
+    employers = {employer.name: employer for employer in db.query(Employer).filter(
+        Employer.name.in_({job_entry.employer for job_entry in job_entries}))}
+    for job_entry in job_entries:
+        if job_entry.employer not in employers:
+            employers[job_entry.employer] = Employer(
+                name=job_entry.employer,
+                url=job_entry.employer_url,
+                industries=job_entry.industries
+            )
+            db.add(employers[job_entry.employer])
+    # New employers need their ids before the jobs reference them
+    db.flush()
 
+    # Postings stored by a previous or concurrent search are skipped by the
+    # unique job_id constraint instead of failing the whole batch
+    inserted = dict(db.execute(
+        insert(Job).values([{
+            "job_id": job_entry.job_id,
+            "title": job_entry.job_title,
+            "location": job_entry.job_location,
+            "url": job_entry.job_url,
+            "status": "new",
+            "source": job_entry.source,
+            "employer_id": employers[job_entry.employer].id,
+        } for job_entry in job_entries]).on_conflict_do_nothing(
+            index_elements=[Job.job_id]).returning(Job.job_id, Job.id)
+    ).all())
 
-def update_job_status(db: Session, job_id: int, status: str) -> bool:
+    if inserted:
+        db.execute(insert(JobMeta), [{
+            "job_id": inserted[job_entry.job_id],
+            "job_description": job_entry.job_description,
+            "employment_type": job_entry.employment_type,
+            "job_function": job_entry.job_function,
+            "seniority_level": job_entry.seniority_level,
+            "ai_metadata": job_entry.job_summary,
+            "cover_letter": job_entry.cover_letter,
+        } for job_entry in job_entries if job_entry.job_id in inserted])
+
+    # Jobs can be re-created by a new search, so don't wait for the WAL flush
+    db.execute(text("SET LOCAL synchronous_commit TO OFF"))
+    # Store the whole batch in a single transaction
+    db.commit()
+
+
+def delete_job(db: Session, job_id: int) -> bool:
     db_job = get_job(db, job_id)
     if not db_job:
         return False
-    
-    db_job.status = status
+
+    # Delete the Job record
+    db.delete(db_job)
+    # Delete the employer along with its last job; the delete above isn't
+    # flushed yet, so the job itself is excluded explicitly
+    has_other_jobs = db.query(exists().where(
+        Job.employer_id == db_job.employer_id, Job.id != db_job.id)).scalar()
+    if not has_other_jobs:
+        db.delete(db_job.employer)
     db.commit()
     return True
+
+
+def update_job_status(db: Session, job_id: int, status: str) -> bool:
+    # Single UPDATE instead of loading the job first
+    updated = db.query(Job).filter(Job.id == job_id).update(
+        {Job.status: status}, synchronize_session=False)
+    db.commit()
+    return updated > 0
@@ -5,9 +5,12 @@ from datetime import datetime
 from scrapy import signals
 from scrapy.crawler import CrawlerProcess
 from scrapy.signalmanager import dispatcher
+from celery import Signature, Task, chain, chord
 from celery.utils.log import get_task_logger
+from google.genai.errors import ClientError
 from google.genai.types import FunctionDeclaration, Tool
 from app.celery_app import celery_app
+from app.config.loader import settings
 from app.core.spiders.linkedin_api_spider import LinkedInSpider
 from app.core.llm.google import GoogleAIProvider
 from app.core.llm.ollama import OllamaProvider
@@ -17,6 +20,9 @@ from app.schemas.task import AIProcessedJobResult
 
 logger = get_task_logger(__name__)
 
+# Keep-alive connections to the backend webhook across tasks
+http_session = requests.Session()
+
 
 def calculate_month_between(start_date: str, end_date: str) -> int:
     """
@@ -295,89 +301,8 @@ callable_tools = {
 }
 
 
-class SearchPipeline:
-    def __init__(self, spider_config: dict, ai_config: dict, provider: str, user_cv: dict, webhook: str):
-        self.spider_config: SpiderConfig = SpiderConfig.model_validate(
-            spider_config)
-        self.ai_config: AIProviderConfig = AIProviderConfig.model_validate(
-            ai_config)
-        self.user_cv: CV = CV.model_validate(user_cv)
-
-        self.webhook = webhook
-
-        # Initialize AI provider based on config
-        if provider.lower() == "google":
-            self.provider = GoogleAIProvider(self.ai_config, logger)
-        elif provider.lower() == "ollama":
-            self.provider = OllamaProvider(self.ai_config, logger)
-        else:
-            raise ValueError(
-                f"Unsupported AI provider: {provider}")
-        self.provider.system_prompt = self._get_system_prompt()
-        self.provider.tools = tools
-        self.provider.callable_tools = callable_tools
-
-    def run(self) -> None:
-        jobs: List[dict] = []
-
-        for job in self._crawl():
-            self.provider.clear_history()
-            processed_job = self._process_job_with_ai(job)
-            if processed_job:
-                jobs.append(processed_job)
-
-        self._handle_search_task(jobs)
-
-    def _get_user_cv_context(self) -> str:
-        """Get the user CV context."""
-        return self.user_cv.model_dump_json()
-
-    def _get_system_prompt(self) -> str:
-        """Get the system prompt for the AI provider."""
-        return f"""You are an expert job search assistant helping a candidate evaluate and apply for jobs.
-
-NORMALIZED CANDIDATE PROFILE JSON: {self._get_user_cv_context()}
-
-INSTRUCTIONS:
-- Provide personalized, specific advice based on the candidate's background
-- Focus on actionable insights and concrete examples
-- Maintain professional but warm tone
-- Be concise and structured in responses
-"""
-
-    def _crawl(self):
-        """Crawl jobs from the web using Scrapy."""
-        jobs: List[dict] = []
-
-        def crawler_results(signal, sender, item, response, spider):
-            jobs.append(item)
-
-        dispatcher.connect(crawler_results, signal=signals.item_scraped)
-
-        process = CrawlerProcess(settings={
-            "LOG_LEVEL": "INFO",
-            "BOT_NAME": "findajob",
-            "CONCURRENT_REQUESTS_PER_DOMAIN": 1,
-            "DOWNLOAD_DELAY": 1,
-            "FEED_EXPORT_ENCODING": "utf-8",
-            "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36",
-            "DOWNLOAD_HANDLERS": {
-                "http": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-                "https": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
-            },
-            "TWISTED_REACTOR": "twisted.internet.asyncioreactor.AsyncioSelectorReactor",
-        })
-        process.crawl(LinkedInSpider, **
-                      self.spider_config.model_dump(mode="json"))
-        process.start()
-
-        return jobs
-
-    def _process_job_with_ai(self, job: dict):
-        """Process jobs with AI agent."""
-
-        # Generate job summary using the prompt from interface
-        job_summary_prompt = f"""TASK: Create a concise job summary that captures:
+# Prompt templates are invariant across jobs; only the job data is filled in
+JOB_SUMMARY_PROMPT = """TASK: Create a concise job summary that captures:
 
 1. Responsibilities (3-5 key points):
    - Extract the most important responsibilities from the job description
@@ -414,16 +339,12 @@ INSTRUCTIONS:
    - Concise overview of the role and why it's a good fit
    - Focus on the most compelling aspects for your profile
 
-JSON JOB DATA: {json.dumps(job)}
+JSON JOB DATA: {job}
 
 Keep responses concise, specific, and personalized to the candidate's background.
 """
 
-        job_summary = self.provider.agent(
-            job_summary_prompt, JobAiSummary)
-
-        # Generate cover letter using the prompt from interface
-        cover_letter_prompt = """TASK: Create a compelling, personalized cover letter that:
+COVER_LETTER_PROMPT = """TASK: Create a compelling, personalized cover letter that:
 
 **Structure & Format:**
 - Professional greeting (avoid "To Whom It May Concern")
@@ -449,8 +370,61 @@ Keep responses concise, specific, and personalized to the candidate's background
 Make it personal, specific to this opportunity, and compelling based on your actual CV data.
 """
 
+
+class SearchPipeline:
+    def __init__(self, ai_config: dict, provider: str, user_cv: dict):
+        self.ai_config: AIProviderConfig = AIProviderConfig.model_validate(
+            ai_config)
+        self.user_cv: CV = CV.model_validate(user_cv)
+
+        # Initialize AI provider based on config
+        if provider.lower() == "google":
+            self.provider = GoogleAIProvider(self.ai_config, logger)
+        elif provider.lower() == "ollama":
+            self.provider = OllamaProvider(self.ai_config, logger)
+        else:
+            raise ValueError(
+                f"Unsupported AI provider: {provider}")
+        self.provider.system_prompt = self._get_system_prompt()
+        self.provider.tools = tools
+        self.provider.callable_tools = callable_tools
+
+    def run(self, jobs: List[dict]) -> List[dict]:
+        processed_jobs: List[dict] = []
+
+        for job in jobs:
+            self.provider.clear_history()
+            processed_job = self._process_job_with_ai(job)
+            if processed_job:
+                processed_jobs.append(processed_job)
+
+        return processed_jobs
+
+    def _get_user_cv_context(self) -> str:
+        """Get the user CV context."""
+        return self.user_cv.model_dump_json()
+
+    def _get_system_prompt(self) -> str:
+        """Get the system prompt for the AI provider."""
+        return f"""You are an expert job search assistant helping a candidate evaluate and apply for jobs.
+
+NORMALIZED CANDIDATE PROFILE JSON: {self._get_user_cv_context()}
+
+INSTRUCTIONS:
+- Provide personalized, specific advice based on the candidate's background
+- Focus on actionable insights and concrete examples
+- Maintain professional but warm tone
+- Be concise and structured in responses
+"""
+
+    def _process_job_with_ai(self, job: dict):
+        """Process jobs with AI agent."""
+
+        job_summary = self.provider.agent(
+            JOB_SUMMARY_PROMPT.format(job=json.dumps(job)), JobAiSummary)
+
         cover_letter = self.provider.generate(
-            cover_letter_prompt, JobAiCoverLetter)
+            COVER_LETTER_PROMPT, JobAiCoverLetter)
 
         return AIProcessedJobResult(
             **job,
@@ -458,20 +432,124 @@ Make it personal, specific to this opportunity, and compelling based on your act
             cover_letter=cover_letter,
         ).model_dump(mode="json") if job_summary and cover_letter else None
 
-    def _handle_search_task(self, jobs: List[dict]):
-        for job in jobs:
-            res = requests.post(self.webhook, json=AIProcessedJobResult(
-                **job).model_dump(mode="json"))
-            res.raise_for_status()
+
+CRAWLER_SETTINGS = {
+    "LOG_LEVEL": str(settings.LOG_LEVEL),
+    "BOT_NAME": "findajob",
+    "CONCURRENT_REQUESTS_PER_DOMAIN": 1,
+    "DOWNLOAD_DELAY": 1,
+    "FEED_EXPORT_ENCODING": "utf-8",
+    "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36",
+    "DOWNLOAD_HANDLERS": {
+        "http": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
+        "https": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
+    },
+    "TWISTED_REACTOR": "twisted.internet.asyncioreactor.AsyncioSelectorReactor",
+}
+
+
+def crawl(spider_config: SpiderConfig) -> List[dict]:
+    """Crawl jobs from the web using Scrapy."""
+    jobs: List[dict] = []
+    seen: set[str] = set()
+
+    def crawler_results(signal, sender, item, response, spider):
+        # LinkedIn re-lists the same posting across result pages
+        if item["job_id"] not in seen:
+            seen.add(item["job_id"])
+            jobs.append(item)
+
+    dispatcher.connect(crawler_results, signal=signals.item_scraped)
+
+    # Keep Celery's logging setup instead of Scrapy's root handler
+    process = CrawlerProcess(
+        settings=CRAWLER_SETTINGS, install_root_handler=False)
+    process.crawl(LinkedInSpider, **spider_config.model_dump(mode="json"))
+    process.start()
+
+    return jobs
+
+
+def filter_new_jobs(webhook: str, jobs: List[dict]) -> List[dict]:
+    """Drop jobs the backend already stores so they are not analyzed again."""
+    if not jobs:
+        return jobs
+
+    res = http_session.post(f"{webhook}/unknown",
+                            json=[job["job_id"] for job in jobs])
+    res.raise_for_status()
+    unknown = set(res.json())
+    return [job for job in jobs if job["job_id"] in unknown]
+
+
+def post_jobs(webhook: str, jobs: List[dict]) -> None:
+    """Deliver processed jobs to the backend webhook in one batch."""
+    if not jobs:
+        return
+
+    # Jobs are already dumped AIProcessedJobResult payloads
+    res = http_session.post(f"{webhook}/batch", json=jobs)
+    res.raise_for_status()
 
 
 @celery_app.task
-def run_search_pipeline(spider_config: dict, ai_config: dict, provider: str, user_cv: dict, webhook: str) -> None:
+def crawl_jobs(spider_config: dict) -> List[dict]:
+    return crawl(SpiderConfig.model_validate(spider_config))
+
+
+def analyze_batch(task: Task, jobs: List[dict], ai_config: dict, provider: str, user_cv: dict) -> List[dict]:
+    """Run the AI pipeline over one batch, backing off on provider rate limits."""
     pipeline = SearchPipeline(
-        spider_config=spider_config,
         ai_config=ai_config,
         provider=provider,
         user_cv=user_cv,
-        webhook=webhook
     )
-    pipeline.run()
+    try:
+        return pipeline.run(jobs)
+    except ClientError as e:
+        # Back off only when the provider reports rate limiting
+        if e.code != 429:
+            raise
+        raise task.retry(exc=e, countdown=2 ** (task.request.retries + 1))
+
+
+# Small runs are analyzed inline, so this task is rate limited and retried like a batch
+@celery_app.task(bind=True, acks_late=True, rate_limit=settings.AI_RATE_LIMIT, max_retries=5)
+def process_jobs_with_ai(self, jobs: List[dict], ai_config: dict, provider: str, user_cv: dict, webhook: str) -> None:
+    jobs = filter_new_jobs(webhook, jobs)
+    if not jobs:
+        logger.info("No new jobs to process")
+        return
+
+    batch_size = settings.AI_BATCH_SIZE
+    if len(jobs) <= batch_size:
+        # A single batch gains nothing from a chord; analyze it inline
+        post_jobs(webhook, analyze_batch(
+            self, jobs, ai_config, provider, user_cv))
+        return
+
+    # Analyze mini-batches in parallel and store them once all are done
+    raise self.replace(chord(
+        (process_job_batch.s(jobs[i:i + batch_size], ai_config, provider, user_cv)
+         for i in range(0, len(jobs), batch_size)),
+        store_jobs.s(webhook),
+    ))
+
+
+# Skip the per-batch STARTED state write; the chord only needs the result
+@celery_app.task(bind=True, acks_late=True, track_started=False, rate_limit=settings.AI_RATE_LIMIT, max_retries=5)
+def process_job_batch(self, jobs: List[dict], ai_config: dict, provider: str, user_cv: dict) -> List[dict]:
+    return analyze_batch(self, jobs, ai_config, provider, user_cv)
+
+
+@celery_app.task
+def store_jobs(batches: List[List[dict]], webhook: str) -> None:
+    post_jobs(webhook, [job for batch in batches for job in batch])
+
+
+def search_pipeline(spider_config: dict, ai_config: dict, provider: str, user_cv: dict, webhook: str) -> Signature:
+    """Build the crawl -> AI processing workflow as a single Celery chain."""
+    return chain(
+        crawl_jobs.s(spider_config),
+        process_jobs_with_ai.s(ai_config, provider, user_cv, webhook),
+    )